@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark mémoire de willkommen_v2 avec des objectifs géants
+
+Génère, pour chaque langage, un projet dont l'objectif fait de 1 Ko à 100 Mo
+(rendu du template, écriture des fichiers, enregistrement de génération) sous
+le profileur `MemProfiler` de `--memprofile`, puis affiche le pic mémoire
+rapporté à la taille de l'objectif.
+
+Le ratio pic / taille doit rester constant quand l'objectif grossit : la
+mémoire est bornée par un petit multiple de l'entrée (les copies de
+l'objectif dans les fichiers générés), sans dérive liée au lot. Le script
+sort en erreur (code 1) si le ratio dépasse --max-ratio pour un objectif
+d'au moins 1 Mo.
+
+Usage:
+    python bench_memory.py                 # tailles par défaut, jusqu'à 100 Mo
+    python bench_memory.py --max-mb 10     # s'arrêter à 10 Mo
+    python bench_memory.py --lang go python
+    python bench_memory.py --max-ratio 5.5  # seuil plus strict
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+from pathlib import Path
+
+import willkommen_v2 as wk
+
+SIZES = [1_000, 1_000_000, 10_000_000, 100_000_000]
+# Pic toléré, en multiples de la taille de l'objectif (jusqu'à 5 copies par template)
+DEFAULT_MAX_RATIO = 6.0
+
+
+def run(langs, max_bytes):
+    wk._memprofiler = profiler = wk.MemProfiler()
+    print(f"{'langage':<12}{'objectif':>14}{'pic':>16}{'pic/objectif':>14}")
+    worst = 0.0
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in [s for s in SIZES if s <= max_bytes]:
+            objective = "x" * size
+            for lang in langs:
+                name = f"bench {lang} {size}"
+                folder = Path(tmp) / name.replace(" ", "-")
+                filename = wk.LANGUAGES[lang]["default_file"]
+                with profiler.phase(folder.name, "project"):
+                    files = wk.scaffold_for(lang)(name, objective, filename, project=folder.name)
+                    wk.write_files(folder, files, lang, project=folder.name)
+                    wk.write_generation_record(folder, lang, name, objective, filename, files)
+                    del files
+                peak = profiler.projects[folder.name]["project"]
+                ratio = peak / size
+                if size >= 1_000_000:
+                    worst = max(worst, ratio)
+                print(f"{lang:<12}{size:>14,}{peak:>16,}{ratio:>14.2f}")
+                gc.collect()
+            del objective
+    print(f"\nPic du lot : {profiler.batch_peak:,} octets — ratio max (>= 1 Mo) : {worst:.2f}")
+    return worst
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Benchmark mémoire (objectifs géants)")
+    p.add_argument("--max-mb", type=float, default=100, help="Taille maximale de l'objectif en Mo (défaut: 100)")
+    p.add_argument("--lang", nargs="+", choices=list(wk.LANGUAGES), default=list(wk.LANGUAGES), help="Langages à tester")
+    p.add_argument("--max-ratio", type=float, default=DEFAULT_MAX_RATIO, help=f"Ratio pic/objectif maximal toléré (défaut: {DEFAULT_MAX_RATIO})")
+    args = p.parse_args(argv)
+    worst = run(args.lang, int(args.max_mb * 1_000_000))
+    if worst > args.max_ratio:
+        print(f"ÉCHEC : ratio {worst:.2f} > {args.max_ratio:.2f}", file=sys.stderr)
+        return 1
+    print(f"OK : ratio {worst:.2f} <= {args.max_ratio:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""Bundle des templates : rendu identique aux templates intégrés, blobs corrompus écartés."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import willkommen_v2 as wk  # noqa: E402
+
+
+def _use_bundle(monkeypatch, path: Path) -> None:
+    monkeypatch.setattr(wk, "_bundle", wk.load_bundle(path) or {})
+    monkeypatch.setattr(wk, "_bundle_templates", {})
+
+
+def test_bundle_renders_like_builtin_templates(tmp_path, monkeypatch):
+    path = tmp_path / "templates.bundle"
+    assert wk.build_bundle(path) == list(wk.LANGUAGES)
+    _use_bundle(monkeypatch, path)
+
+    for lang, meta in wk.LANGUAGES.items():
+        args = ("Mon Projet", "Afficher {x} et } seul", meta["default_file"])
+        assert wk.scaffold_for(lang)(*args) == meta["scaffold"](*args), lang
+        assert wk._bundle_templates[lang] is not None
+
+
+def test_flipped_byte_inside_a_string_falls_back_to_builtin(tmp_path, monkeypatch):
+    path = tmp_path / "templates.bundle"
+    wk.build_bundle(path)
+    data = bytearray(path.read_bytes())
+    data[data.index(b"Hello", data.index(b"package main"))] ^= 0x20
+    path.write_bytes(bytes(data))
+    _use_bundle(monkeypatch, path)
+
+    files = wk.scaffold_for("go")("Demo", "Dire bonjour", "main.go")
+
+    assert wk._bundle_templates["go"] is None
+    assert files == wk.tpl_go("Demo", "Dire bonjour", "main.go")
+    # Les autres blobs restent utilisables
+    assert wk.scaffold_for("python")("Demo", "x", "main.py") == wk.tpl_python("Demo", "x", "main.py")
+    assert wk._bundle_templates["python"] is not None
@@ -0,0 +1,106 @@
+"""Édition par numéro de ligne : `editer_lignes` et son index de lignes en cache."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import willkommen_v2 as wk  # noqa: E402
+
+SEP = os.linesep.encode()
+
+
+def _write(tmp_path: Path, data: bytes) -> Path:
+    path = tmp_path / "main.py"
+    path.write_bytes(data)
+    wk._line_index_cache.pop(path.resolve(), None)
+    return path
+
+
+def _assert_index_fresh(path: Path) -> None:
+    """L'index mis à jour incrémentalement doit égaler un index recalculé."""
+    cached = wk.line_offsets(path)
+    wk._line_index_cache.pop(path.resolve(), None)
+    assert cached == wk.line_offsets(path)
+
+
+def test_insert_after_last_line_without_trailing_newline(tmp_path):
+    path = _write(tmp_path, b"a\nb")
+
+    wk.editer_lignes(path, 3, ["c"])
+
+    assert path.read_bytes() == b"a\nb" + SEP + b"c" + SEP
+    _assert_index_fresh(path)
+
+
+def test_multi_line_replace(tmp_path):
+    path = _write(tmp_path, b"1\n2\n3\n4\n")
+
+    wk.editer_lignes(path, 2, ["x", "y", "z"], delete=2)
+
+    assert path.read_bytes() == b"1\nx" + SEP + b"y" + SEP + b"z" + SEP + b"4\n"
+    _assert_index_fresh(path)
+
+
+def test_multi_line_delete(tmp_path):
+    path = _write(tmp_path, b"1\n2\n3\n4\n")
+
+    wk.editer_lignes(path, 2, [], delete=3)
+
+    assert path.read_bytes() == b"1\n"
+    _assert_index_fresh(path)
+
+
+def test_delete_count_past_end_of_file_is_rejected(tmp_path):
+    path = _write(tmp_path, b"1\n2\n3\n")
+
+    with pytest.raises(ValueError, match="il n'en reste que 2"):
+        wk.editer_lignes(path, 2, [], delete=5)
+    with pytest.raises(ValueError, match="hors du fichier"):
+        wk.editer_lignes(path, 4, [], delete=1)
+    assert path.read_bytes() == b"1\n2\n3\n"
+
+
+def test_consecutive_edits_reuse_cached_index(tmp_path, monkeypatch):
+    path = _write(tmp_path, b"1\n2\n3\n")
+    wk.line_offsets(path)
+    real_line_offsets = wk.line_offsets
+    misses = []
+
+    def counting_line_offsets(file_path):
+        st = file_path.stat()
+        cached = wk._line_index_cache.get(file_path.resolve())
+        if not (cached and cached[:2] == (st.st_mtime_ns, st.st_size)):
+            misses.append(file_path)
+        return real_line_offsets(file_path)
+
+    monkeypatch.setattr(wk, "line_offsets", counting_line_offsets)
+
+    wk.editer_lignes(path, 1, ["0"])
+    wk.editer_lignes(path, 3, ["deux"], delete=1)
+    wk.editer_lignes(path, 5, ["4"])
+    wk.editer_lignes(path, 2, [], delete=1)
+
+    assert misses == []
+    assert path.read_bytes() == b"0" + SEP + b"deux" + SEP + b"3\n4" + SEP
+    monkeypatch.undo()
+    _assert_index_fresh(path)
+
+
+def test_large_file_edit_goes_through_temporary_copy(tmp_path):
+    body = b"".join(b"ligne %d\n" % i for i in range(20_000))
+    assert len(body) > wk.IN_PLACE_TAIL_LIMIT
+    path = _write(tmp_path, body)
+    inode = path.stat().st_ino
+
+    wk.editer_lignes(path, 2, ["insérée"])
+
+    lines = body.split(b"\n")
+    assert path.read_bytes() == lines[0] + b"\n" + "insérée".encode() + SEP + b"\n".join(lines[1:])
+    # Branche par fichier temporaire : le fichier a été remplacé par renommage
+    assert path.stat().st_ino != inode
+    assert not [p for p in tmp_path.iterdir() if p.name.startswith(".main.py.")]
+    _assert_index_fresh(path)
@@ -0,0 +1,64 @@
+"""Fusion à trois voies `merge3` (base générée, fichier local, nouveau template)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import willkommen_v2 as wk  # noqa: E402
+
+CONFLICT = "<<<<<<< local\n{ours}=======\n{theirs}>>>>>>> template\n"
+
+
+def test_changes_on_both_sides_merge_cleanly():
+    base = "a\nb\nc\nd\ne\n"
+    ours = "a\nb\nc\nd\ne\nf\n"
+    theirs = "A\nb\nc\nd\ne\n"
+
+    assert wk.merge3(base, ours, theirs) == ("A\nb\nc\nd\ne\nf\n", 0)
+
+
+def test_one_sided_changes_are_taken_as_is():
+    base = "a\nb\n"
+
+    assert wk.merge3(base, "a\nB\n", base) == ("a\nB\n", 0)
+    assert wk.merge3(base, base, "A\nb\n") == ("A\nb\n", 0)
+    assert wk.merge3(base, "a\nx\n", "a\nx\n") == ("a\nx\n", 0)
+
+
+def test_both_sides_appending_at_end_of_file_conflict():
+    base = "a\nb\n"
+
+    merged, conflicts = wk.merge3(base, base + "local\n", base + "template\n")
+
+    assert conflicts == 1
+    assert merged == base + CONFLICT.format(ours="local\n", theirs="template\n")
+
+
+def test_empty_base():
+    assert wk.merge3("", "x\n", "") == ("x\n", 0)
+    assert wk.merge3("", "", "y\n") == ("y\n", 0)
+    assert wk.merge3("", "x\n", "y\n") == (CONFLICT.format(ours="x\n", theirs="y\n"), 1)
+
+
+def test_lines_without_trailing_newline():
+    assert wk.merge3("a\nb", "A\nb", "a\nB") == ("A\nB", 0)
+    # Ajout en fin de fichier côté local alors que le template modifie le début
+    assert wk.merge3("a\nb", "a\nb\nc\n", "A\nb") == ("A\nb\nc\n", 0)
+    # Marqueurs toujours sur leur propre ligne, même sans saut de ligne final
+    assert wk.merge3("a\nb", "a\nb2", "a\nb3") == ("a\n" + CONFLICT.format(ours="b2\n", theirs="b3\n"), 1)
+
+
+def test_adjacent_edits_merge_cleanly():
+    # Choix délibéré (git signalerait un conflit) : deux modifications de
+    # lignes voisines, sans chevauchement, sont fusionnées
+    assert wk.merge3("a\nb\nc\n", "A\nb\nc\n", "a\nB\nc\n") == ("A\nB\nc\n", 0)
+    assert wk.merge3("a\nb\nc\n", "a\nb\nC\n", "a\nB\nc\n") == ("a\nB\nC\n", 0)
+
+
+def test_insertions_at_the_same_point_conflict():
+    # Contrairement aux modifications adjacentes : l'ordre des lignes insérées est ambigu
+    merged, conflicts = wk.merge3("a\nb\n", "a\nx\nb\n", "a\ny\nb\n")
+
+    assert conflicts == 1
+    assert merged == "a\n" + CONFLICT.format(ours="x\n", theirs="y\n") + "b\n"
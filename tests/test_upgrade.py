@@ -0,0 +1,44 @@
+"""Régressions de `upgrade` : re-rendu des templates datés (Markdown)."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import willkommen_v2 as wk  # noqa: E402
+
+
+def _generate_markdown(tmp_path: Path, created: str) -> Path:
+    folder = tmp_path / "doc"
+    folder.mkdir()
+    files = wk.tpl_markdown("Doc", "Notes", "document.md", created=created)
+    wk.write_files(folder, files, "markdown")
+    wk.write_generation_record(folder, "markdown", "Doc", "Notes", "document.md", files)
+    record_path = folder / wk.GENERATION_RECORD
+    record = json.loads(record_path.read_text(encoding="utf-8"))
+    record["created"] = created
+    record_path.write_text(json.dumps(record), encoding="utf-8")
+    return folder
+
+
+def test_old_markdown_project_is_unchanged(tmp_path):
+    folder = _generate_markdown(tmp_path, "2020-03-01")
+    before = (folder / "document.md").read_text(encoding="utf-8")
+
+    result = wk.upgrade_project(str(folder))
+
+    assert result["merged"] == [] and result["conflicts"] == []
+    assert (folder / "document.md").read_text(encoding="utf-8") == before
+
+
+def test_old_markdown_project_with_appended_content_does_not_conflict(tmp_path):
+    folder = _generate_markdown(tmp_path, "2020-03-01")
+    with (folder / "document.md").open("a", encoding="utf-8") as f:
+        f.write("Contenu ajouté par l'étudiant\n")
+    edited = (folder / "document.md").read_text(encoding="utf-8")
+
+    result = wk.upgrade_project(str(folder))
+
+    assert result["conflicts"] == []
+    assert (folder / "document.md").read_text(encoding="utf-8") == edited
@@ -0,0 +1,40 @@
+"""Régressions de `watch` : une ligne modifiée du manifeste n'écrase pas le travail existant."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import willkommen_v2 as wk  # noqa: E402
+
+
+def _manifest(tmp_path: Path, objective: str) -> Path:
+    path = tmp_path / "classe.csv"
+    path.write_text(f"lang,name,objective\npython,Demo,{objective}\n", encoding="utf-8")
+    return path
+
+
+def test_updated_row_keeps_student_lines(tmp_path):
+    state = wk.apply_manifest_delta(_manifest(tmp_path, "Dire bonjour"), {}, None)
+    main = tmp_path / "demo" / "main.py"
+    with main.open("a", encoding="utf-8") as f:
+        f.write("print('ajout étudiant')\n")
+
+    wk.apply_manifest_delta(_manifest(tmp_path, "Dire au revoir"), state, None)
+
+    content = main.read_text(encoding="utf-8")
+    assert "Dire au revoir" in content
+    assert content.endswith("print('ajout étudiant')\n")
+    assert not main.with_name("main.py.merge").exists()
+
+
+def test_updated_row_reports_conflict_without_overwriting(tmp_path):
+    state = wk.apply_manifest_delta(_manifest(tmp_path, "Dire bonjour"), {}, None)
+    main = tmp_path / "demo" / "main.py"
+    edited = main.read_text(encoding="utf-8").replace("Dire bonjour", "Mon objectif")
+    main.write_text(edited, encoding="utf-8")
+
+    wk.apply_manifest_delta(_manifest(tmp_path, "Dire au revoir"), state, None)
+
+    assert main.read_text(encoding="utf-8") == edited
+    assert "Dire au revoir" in main.with_name("main.py.merge").read_text(encoding="utf-8")
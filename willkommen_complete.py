@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Complétion shell rapide pour willkommen_v2.py
+
+Appelé par bash via `complete -C` (voir `willkommen_v2.py completion`) :
+bash fournit COMP_LINE / COMP_POINT et les arguments (commande, mot courant,
+mot précédent) ; on imprime les candidats, un par ligne.
+
+Ce module n'importe ni rich, ni questionary, ni les templates (pas même
+json) : il répond depuis un index `marshal` en cache. L'index n'est régénéré
+(exécution complète de `willkommen_v2.py completion`) que lorsque
+willkommen_v2.py a changé.
+"""
+
+import marshal
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(HERE, "willkommen_v2.py")
+CACHE_DIR = os.environ.get("WILLKOMMEN_CACHE") or os.path.join(os.path.expanduser("~"), ".cache", "willkommen_v2")
+INDEX_PATH = os.path.join(CACHE_DIR, "completion.marshal")
+
+
+def _source_signature():
+    st = os.stat(SOURCE)
+    return [SOURCE, st.st_mtime_ns, st.st_size]
+
+
+def save_index(index):
+    """Enregistre l'index avec la signature de willkommen_v2.py (écriture atomique)."""
+    index = dict(index, source=_source_signature())
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{INDEX_PATH}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            marshal.dump(index, f)
+        os.replace(tmp, INDEX_PATH)
+    except OSError:
+        # Cache non inscriptible : l'index sera reconstruit au prochain appel
+        pass
+    return index
+
+
+def load_index():
+    """Retourne l'index en cache, ou le reconstruit si willkommen_v2.py a changé."""
+    try:
+        with open(INDEX_PATH, "rb") as f:
+            index = marshal.load(f)
+        if index.get("source") == _source_signature():
+            return index
+    except (OSError, ValueError, EOFError, TypeError, AttributeError):
+        pass
+
+    # Chemin lent (une fois par modification des templates) : le script complet
+    # régénère l'index dans un processus séparé (avec site-packages, même sous -S)
+    import subprocess
+
+    subprocess.run(
+        [sys.executable, SOURCE, "completion"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    with open(INDEX_PATH, "rb") as f:
+        return marshal.load(f)
+
+
+def complete(words, cur, prev, index):
+    """Retourne les candidats pour le mot courant `cur`.
+
+    words: mots déjà saisis avant le mot courant (sans le nom du programme).
+    """
+    subcommands = index["subcommands"]
+    sub = next((w for w in words if w in subcommands), None)
+    if sub is None:
+        candidates = subcommands + ["-h", "--help"]
+    else:
+        choices = index["choices"].get(sub, {})
+        if prev in choices:
+            candidates = choices[prev]
+        elif prev in index["takes_value"].get(sub, []):
+            # Valeur libre (--dir, --name...) : laisser bash compléter les chemins
+            return []
+        elif not cur.startswith("-") and "" in choices:
+            candidates = choices[""]
+        else:
+            used = set(words)
+            candidates = [o for o in index["options"].get(sub, []) if o not in used]
+    return [c for c in candidates if c.startswith(cur)]
+
+
+def main(argv):
+    line = os.environ.get("COMP_LINE", "")
+    point = int(os.environ.get("COMP_POINT", len(line)))
+    cur = argv[2] if len(argv) > 2 else ""
+    prev = argv[3] if len(argv) > 3 else ""
+    before = line[:point]
+    words = before.split()[1:]
+    if cur and words and words[-1] == cur:
+        words = words[:-1]
+    try:
+        index = load_index()
+    except Exception:
+        return 1
+    out = complete(words, cur, prev, index)
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -20,8 +20,15 @@ Modes:
 from __future__ import annotations
 
 import argparse
+import atexit
+import collections
+import contextlib
+import json
 import sys
 import os
+import subprocess
+import threading
+import time
 from pathlib import Path
 from typing import Dict, Callable, List, Tuple
 from typing import Union
@@ -49,6 +56,9 @@ CUSTOM_STYLE = Style([
 
 console = Console()
 
+# Cache utilisateur (environnement Python de base, bundle des templates...)
+CACHE_DIR = Path(os.environ.get("WILLKOMMEN_CACHE") or Path.home() / ".cache" / "willkommen_v2")
+
 # Surcharge du symbole de question (qmark) pour afficher '>' au lieu de '?'
 questionary.prompts.common.PROMPTS_STYLE_OVERRIDES = {"qmark": ">"}
 questionary.prompts.common.DEFAULT_QUESTION_PREFIX = ">"
@@ -376,9 +386,11 @@ Ouvrez `index.html` dans votre navigateur.
     ]
 
 
-def tpl_markdown(prog_name: str, objective: str, filename: str) -> List[Tuple[str, str]]:
-    date_creation = __import__('datetime').date.today().strftime('%d %B %Y')
-    date_modification = __import__('datetime').date.today().strftime('%d %B %Y')
+def tpl_markdown(prog_name: str, objective: str, filename: str, created: str | None = None) -> List[Tuple[str, str]]:
+    # created: date ISO de génération (re-rendu par `upgrade`), aujourd'hui par défaut
+    day = __import__('datetime').date.fromisoformat(created) if created else __import__('datetime').date.today()
+    date_creation = day.strftime('%d %B %Y')
+    date_modification = day.strftime('%d %B %Y')
     main_md = f"""# {prog_name}
 
 **Objectif:** {objective}
@@ -463,10 +475,476 @@ LANGUAGES: Dict[str, Dict[str, object]] = {
         "label": "Markdown 📝",
         "default_file": "document.md",
         "scaffold": tpl_markdown,
+        # Le template accepte `created` (date de génération)
+        "dated": True,
     },
 }
 
 
+# -----------------------------
+# METRIQUES (OpenMetrics)
+# -----------------------------
+# Bornes des histogrammes de latence (secondes)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class Metrics:
+    """Registre en mémoire de compteurs et d'histogrammes, exportable en OpenMetrics.
+
+    Une incrémentation coûte une recherche de dictionnaire sous verrou ;
+    le rendu texte n'est fait qu'à l'export.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        # nom, labels -> [comptes par borne..., +Inf, somme]
+        self._histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[float]] = {}
+        self._help: Dict[str, Tuple[str, str]] = {}
+
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        self._help[name] = (kind, help_text)
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            h = self._histograms.get(key)
+            if h is None:
+                h = self._histograms[key] = [0.0] * (len(LATENCY_BUCKETS) + 2)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    h[i] += 1
+                    break
+            else:
+                h[len(LATENCY_BUCKETS)] += 1
+            h[-1] += value
+
+    @staticmethod
+    def _number(value: float) -> str:
+        # Valeur exacte : entier sans exposant, flottant avec toute sa précision
+        if float(value).is_integer():
+            return str(int(value))
+        return repr(float(value))
+
+    @staticmethod
+    def _labels(pairs: Tuple[Tuple[str, str], ...], extra: str = "") -> str:
+        def esc(v: str) -> str:
+            return v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+        items = [f'{k}="{esc(str(v))}"' for k, v in pairs]
+        if extra:
+            items.append(extra)
+        return "{" + ",".join(items) + "}" if items else ""
+
+    def render(self) -> str:
+        """Retourne l'exposition OpenMetrics (texte) de toutes les métriques."""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {k: list(v) for k, v in self._histograms.items()}
+        lines: List[str] = []
+        for family in sorted({n for n, _ in counters} | {n for n, _ in histograms}):
+            kind, help_text = self._help.get(family, ("counter" if any(n == family for n, _ in counters) else "histogram", ""))
+            lines.append(f"# TYPE {family} {kind}")
+            if help_text:
+                lines.append(f"# HELP {family} {help_text}")
+            for (name, labels), value in sorted(counters.items()):
+                if name == family:
+                    lines.append(f"{family}_total{self._labels(labels)} {self._number(value)}")
+            for (name, labels), h in sorted(histograms.items()):
+                if name != family:
+                    continue
+                cumulative = 0.0
+                for bound, count in zip(LATENCY_BUCKETS, h):
+                    cumulative += count
+                    le = self._labels(labels, 'le="%s"' % bound)
+                    lines.append(f"{family}_bucket{le} {self._number(cumulative)}")
+                cumulative += h[len(LATENCY_BUCKETS)]
+                le = self._labels(labels, 'le="+Inf"')
+                lines.append(f"{family}_bucket{le} {self._number(cumulative)}")
+                lines.append(f"{family}_sum{self._labels(labels)} {self._number(h[-1])}")
+                lines.append(f"{family}_count{self._labels(labels)} {self._number(cumulative)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Path) -> None:
+        """Écrit l'exposition dans un fichier (remplacement atomique, pour un collecteur textfile)."""
+        ensure_dir(path.parent)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> object:
+        """Expose `/metrics` en HTTP local dans un thread démon ; retourne le serveur."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/openmetrics-text; version=1.0.0; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+METRICS = Metrics()
+METRICS.describe("willkommen_projects_written", "counter", "Projets écrits par langage")
+METRICS.describe("willkommen_files_written", "counter", "Fichiers écrits par langage")
+METRICS.describe("willkommen_bytes_written", "counter", "Octets écrits par langage")
+METRICS.describe("willkommen_write_failures", "counter", "Échecs d'écriture par cause")
+METRICS.describe("willkommen_upgrade_files", "counter", "Fichiers traités par upgrade, par résultat")
+METRICS.describe("willkommen_upgrade_failures", "counter", "Projets qu'upgrade n'a pas pu traiter")
+METRICS.describe("willkommen_render_seconds", "histogram", "Durée du rendu des templates")
+METRICS.describe("willkommen_write_seconds", "histogram", "Durée de l'écriture d'un projet")
+
+
+def failure_cause(exc: OSError) -> str:
+    """Classe une erreur d'écriture : permission, exists, disk_full ou other."""
+    import errno
+
+    if exc.errno in (errno.EACCES, errno.EPERM, errno.EROFS):
+        return "permission"
+    if exc.errno in (errno.EEXIST, errno.ENOTDIR, errno.EISDIR):
+        return "exists"
+    if exc.errno in (errno.ENOSPC, errno.EDQUOT):
+        return "disk_full"
+    return "other"
+
+
+# -----------------------------
+# PROFIL MEMOIRE (--memprofile)
+# -----------------------------
+class MemProfiler:
+    """Mesure la mémoire des phases render / write / append avec tracemalloc.
+
+    Pour chaque projet : pic (octets au-dessus du niveau de départ) par phase.
+    Pour le lot : pic global et principaux sites d'allocation de la phase la
+    plus gourmande (allocations faites pendant la phase et encore vivantes à sa fin).
+    """
+
+    def __init__(self, top: int = 10) -> None:
+        import tracemalloc
+
+        self.top = top
+        self.projects: Dict[str, Dict[str, int]] = {}
+        self.batch_peak = 0
+        self._heaviest: Tuple[int, List[object]] | None = None
+        self._stack: List[List[int]] = []
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextlib.contextmanager
+    def phase(self, project: str, name: str):  # type: ignore[no-untyped-def]
+        import tracemalloc
+
+        own = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        before = tracemalloc.take_snapshot().filter_traces(own)
+        # Phases imbriquées : avant de remettre le pic à zéro pour la phase
+        # interne, le pic courant est reporté sur la phase englobante.
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], tracemalloc.get_traced_memory()[1])
+        if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        frame = [start, start]  # [niveau de départ, pic observé]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            frame[1] = max(frame[1], tracemalloc.get_traced_memory()[1])
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], frame[1])
+            used = frame[1] - start
+            phases = self.projects.setdefault(project, {})
+            phases[name] = max(phases.get(name, 0), used)
+            self.batch_peak = max(self.batch_peak, frame[1])
+            if self._heaviest is None or used > self._heaviest[0]:
+                diff = tracemalloc.take_snapshot().filter_traces(own).compare_to(before, "lineno")
+                self._heaviest = (used, [d for d in diff if d.size_diff > 0][:self.top])
+
+    def report(self) -> Dict[str, object]:
+        """Retourne le rapport (sérialisable en JSON)."""
+        top: List[Dict[str, object]] = []
+        for stat in (self._heaviest[1] if self._heaviest else []):
+            frame = stat.traceback[0]  # type: ignore[attr-defined]
+            top.append({
+                "site": f"{frame.filename}:{frame.lineno}",
+                "bytes": stat.size_diff,  # type: ignore[attr-defined]
+                "count": stat.count_diff,  # type: ignore[attr-defined]
+            })
+        return {
+            "batch_peak_bytes": self.batch_peak,
+            "projects": {
+                name: {"peak_bytes": max(phases.values()), **{f"{k}_bytes": v for k, v in phases.items()}}
+                for name, phases in self.projects.items()
+            },
+            "top_allocations": top,
+        }
+
+    def print_report(self) -> None:
+        rep = self.report()
+        console.print(f"\n🧠 [bold]Profil mémoire[/bold] — pic du lot : [cyan]{rep['batch_peak_bytes']:,}[/cyan] octets")
+        for name, phases in rep["projects"].items():  # type: ignore[union-attr]
+            detail = ", ".join(f"{k[:-6]}={v:,}" for k, v in phases.items() if k != "peak_bytes")
+            console.print(f"  • {name}: pic {phases['peak_bytes']:,} octets ({detail})")
+        if rep["top_allocations"]:
+            console.print("  [dim]Principaux sites d'allocation :[/dim]")
+            for entry in rep["top_allocations"]:  # type: ignore[union-attr]
+                console.print(f"    {entry['bytes']:>12,} o  {entry['count']:>6}×  {entry['site']}")
+
+
+_memprofiler: MemProfiler | None = None
+
+
+def mem_phase(project: str, name: str):  # type: ignore[no-untyped-def]
+    """Contexte de mesure d'une phase ; sans effet si --memprofile n'est pas actif."""
+    if _memprofiler is None:
+        return contextlib.nullcontext()
+    return _memprofiler.phase(project, name)
+
+
+def project_key(folder: Path) -> str:
+    """Clé d'un projet pour --memprofile : le nom de son dossier (résolu, pour `.`)."""
+    return folder.resolve().name or str(folder)
+
+
+# -----------------------------
+# TEMPLATES EN BUNDLE (fichier unique mappé en mémoire)
+# -----------------------------
+# Format : MAGIC + longueur de l'en-tête (4 octets, big-endian) + en-tête JSON
+# (signature du script, index langage -> offset/longueur/crc32) + blobs marshal.
+# Chaque blob est la liste des (chemin, contenu) du template sous forme de
+# chaînes de format : les valeurs variables y sont des champs {nom}, les
+# accolades littérales sont doublées. Le rendu est un simple `format_map`.
+BUNDLE_MAGIC = b"WKB2"
+BUNDLE_PATH = Path(os.environ.get("WILLKOMMEN_BUNDLE") or CACHE_DIR / "templates.bundle")
+
+# Valeurs sentinelles : chaque dérivation utilisée par les templates
+# (slug, nom pointé, radical du fichier) donne une chaîne distincte.
+_SENTINEL_NAME = "Wkb Name"
+_SENTINEL_OBJECTIVE = "Wkb Objective"
+_SENTINEL_FILENAME = "wkbfile.wkbext"
+_BUNDLE_TOKENS = [
+    # Ordre important : les formes longues avant leurs préfixes
+    (_SENTINEL_FILENAME, "filename"),
+    ("wkbfile", "stem"),
+    (_SENTINEL_NAME, "name"),
+    (_SENTINEL_NAME.lower().replace(" ", "-"), "slug"),
+    (_SENTINEL_NAME.replace(" ", "."), "dotted"),
+    (_SENTINEL_OBJECTIVE, "objective"),
+]
+
+_bundle: Dict[str, object] | None = None
+# Templates du bundle déjà décodés (langage -> fichiers, None si blob invalide) :
+# chaque blob n'est lu et vérifié qu'une fois par processus
+_bundle_templates: Dict[str, List[Tuple[str, str]] | None] = {}
+
+
+def _tokenize(text: str) -> str:
+    today = __import__('datetime').date.today().strftime('%d %B %Y')
+    text = text.replace("{", "{{").replace("}", "}}")
+    for value, token in _BUNDLE_TOKENS + [(today, "today")]:
+        text = text.replace(value, f"{{{token}}}")
+    return text
+
+
+def _source_signature() -> List[object]:
+    st = Path(__file__).stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def build_bundle(path: Path = BUNDLE_PATH) -> List[str]:
+    """Écrit le bundle des templates intégrés et retourne les langages inclus.
+
+    Chaque template est vérifié : s'il ne se réduit pas fidèlement à des jetons
+    (valeur dérivée inattendue), il est laissé hors du bundle et le template
+    intégré reste utilisé pour ce langage.
+    """
+    import marshal
+    import struct
+    import zlib
+
+    blobs: List[Tuple[str, bytes]] = []
+    for lang, meta in LANGUAGES.items():
+        scaffold = meta["scaffold"]
+        rendered = scaffold(_SENTINEL_NAME, _SENTINEL_OBJECTIVE, _SENTINEL_FILENAME)  # type: ignore[operator]
+        tokenized = [(_tokenize(rel), _tokenize(content)) for rel, content in rendered]
+        probe = ("Mon Projet", 'Objectif "cité" {x}', str(meta["default_file"]))
+        expected = scaffold(*probe)  # type: ignore[operator]
+        try:
+            if _render_bundle_files(tokenized, *probe) != expected:
+                continue
+        except (KeyError, ValueError, IndexError):
+            continue
+        blobs.append((lang, marshal.dumps(tokenized)))
+
+    index: Dict[str, object] = {}
+    offset = 0
+    for lang, blob in blobs:
+        index[lang] = [offset, len(blob), zlib.crc32(blob)]
+        offset += len(blob)
+    header = json.dumps({"source": _source_signature(), "index": index}).encode("utf-8")
+
+    ensure_dir(path.parent)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        f.write(BUNDLE_MAGIC + struct.pack(">I", len(header)) + header)
+        for _, blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+    return [lang for lang, _ in blobs]
+
+
+class _TemplateValues(dict):
+    """Valeurs des champs d'un template du bundle ; les dérivées sont calculées à la demande.
+
+    La plupart des templates n'utilisent ni la date ni le radical du fichier :
+    `format_map` ne les demande alors jamais.
+    """
+
+    def __missing__(self, key: str) -> str:
+        if key == "stem":
+            value = os.path.splitext(os.path.basename(self["filename"]))[0]
+        elif key == "slug":
+            value = self["name"].lower().replace(" ", "-")
+        elif key == "dotted":
+            value = self["name"].replace(" ", ".")
+        elif key == "today":
+            created = self["created"]
+            date = __import__('datetime').date
+            value = (date.fromisoformat(created) if created else date.today()).strftime('%d %B %Y')
+        else:
+            raise KeyError(key)
+        self[key] = value
+        return value
+
+
+def _render_bundle_files(
+    files: List[Tuple[str, str]], prog_name: str, objective: str, filename: str, created: str | None = None
+) -> List[Tuple[str, str]]:
+    values = _TemplateValues(name=prog_name, objective=objective, filename=filename, created=created)
+    return [(rel.format_map(values), content.format_map(values)) for rel, content in files]
+
+
+def load_bundle(path: Path = BUNDLE_PATH) -> Dict[str, object] | None:
+    """Mappe le bundle en mémoire et lit son en-tête ; None si absent, invalide ou périmé.
+
+    Seul l'en-tête est lu ici : les octets d'un template ne sont touchés
+    qu'au moment où ce langage est effectivement utilisé.
+    """
+    import mmap
+    import struct
+
+    try:
+        with path.open("rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        if mm[:4] != BUNDLE_MAGIC:
+            raise ValueError("magic")
+        (header_len,) = struct.unpack(">I", mm[4:8])
+        header = json.loads(mm[8:8 + header_len])
+        if header.get("source") != _source_signature():
+            # Templates modifiés depuis `bundle build` : le bundle ne fait plus foi
+            raise ValueError("stale")
+        base = 8 + header_len
+        index = {
+            lang: entry for lang, entry in header["index"].items()
+            # Bundle tronqué : écarter les blobs qui dépassent la fin du fichier
+            if len(entry) == 3 and base + entry[0] + entry[1] <= len(mm)
+        }
+    except (ValueError, KeyError, TypeError, IndexError, struct.error):
+        mm.close()
+        return None
+    return {"mmap": mm, "base": base, "index": index}
+
+
+def _bundle_files(lang: str) -> List[Tuple[str, str]] | None:
+    """Décode (une seule fois) le template `lang` du bundle ; None si absent ou corrompu."""
+    global _bundle
+    if lang in _bundle_templates:
+        return _bundle_templates[lang]
+    if _bundle is None:
+        _bundle = load_bundle() or {}
+    entry = _bundle.get("index", {}).get(lang) if _bundle else None  # type: ignore[union-attr]
+    files = None
+    if entry is not None:
+        import marshal
+        import zlib
+
+        start = _bundle["base"] + entry[0]  # type: ignore[index,operator]
+        blob = _bundle["mmap"][start:start + entry[1]]  # type: ignore[index]
+        # Octet altéré dans une chaîne : marshal le décoderait sans erreur
+        if zlib.crc32(blob) == entry[2]:
+            try:
+                files = marshal.loads(blob)
+            except (ValueError, EOFError, TypeError):
+                files = None
+    _bundle_templates[lang] = files
+    return files
+
+
+def scaffold_for(lang: str) -> Callable[..., List[Tuple[str, str]]]:
+    """Retourne la fonction de scaffold du langage : bundle si disponible, sinon LANGUAGES.
+
+    La fonction retournée accepte `created` (date ISO de génération), transmis
+    aux templates datés pour qu'un re-rendu reproduise le contenu d'origine,
+    et `project` (clé du projet pour --memprofile, le nom du dossier projet).
+    Un blob corrompu (somme de contrôle ou décodage) laisse la main au template intégré.
+    """
+    bundled = _bundle_files(lang)
+    builtin = LANGUAGES[lang]["scaffold"]
+    dated = bool(LANGUAGES[lang].get("dated"))
+
+    def scaffold(
+        prog_name: str, objective: str, filename: str, created: str | None = None, project: str | None = None
+    ) -> List[Tuple[str, str]]:
+        t0 = time.perf_counter()
+        with mem_phase(project or prog_name.lower().replace(" ", "-"), "render"):
+            if bundled is None:
+                extra = {"created": created} if dated and created else {}
+                files = builtin(prog_name, objective, filename, **extra)  # type: ignore[operator]
+            else:
+                files = _render_bundle_files(bundled, prog_name, objective, filename, created)
+        METRICS.observe("willkommen_render_seconds", time.perf_counter() - t0, lang=lang)
+        return files
+
+    return scaffold
+
+
+def run_bundle(args: argparse.Namespace) -> int:
+    path = Path(args.path) if args.path else BUNDLE_PATH
+    try:
+        langs = build_bundle(path)
+    except OSError as e:
+        console.print(f"[red]Erreur lors de l'écriture du bundle {path}: {e}[/red]")
+        return 1
+    skipped = [k for k in LANGUAGES if k not in langs]
+    console.print(f"📦 [cyan]Bundle écrit:[/cyan] {path} ({path.stat().st_size} octets, {len(langs)} templates)")
+    if skipped:
+        console.print(f"[yellow]Templates intégrés conservés pour:[/yellow] {', '.join(skipped)}")
+    return 0
+
+
 # -----------------------------
 # UTILITAIRES
 # -----------------------------
@@ -474,11 +952,311 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def write_files(base: Path, files: List[Tuple[str, str]]) -> None:
-    for rel, content in files:
-        target = base / rel
-        ensure_dir(target.parent)
-        target.write_text(content, encoding="utf-8")
+def write_files(base: Path, files: List[Tuple[str, str]], lang: str = "", project: str | None = None) -> int:
+    """Crée le dossier projet, écrit les fichiers du template et retourne le nombre d'octets écrits.
+
+    lang: étiquette des métriques (compteurs, latence, échecs par cause, y
+    compris l'échec de création du dossier).
+    project: clé du projet pour --memprofile (défaut: `project_key(base)`).
+    """
+    total = 0
+    t0 = time.perf_counter()
+    try:
+        with mem_phase(project or project_key(base), "write"):
+            ensure_dir(base)
+            for rel, content in files:
+                target = base / rel
+                ensure_dir(target.parent)
+                target.write_text(content, encoding="utf-8")
+                # ASCII : taille = nombre de caractères, sans copie encodée du contenu
+                total += len(content) if content.isascii() else len(content.encode("utf-8"))
+    except OSError as e:
+        METRICS.inc("willkommen_write_failures", cause=failure_cause(e), lang=lang)
+        raise
+    METRICS.observe("willkommen_write_seconds", time.perf_counter() - t0, lang=lang)
+    METRICS.inc("willkommen_projects_written", lang=lang)
+    METRICS.inc("willkommen_files_written", len(files), lang=lang)
+    METRICS.inc("willkommen_bytes_written", total, lang=lang)
+    return total
+
+
+class JsonlWriter:
+    """Émet des événements JSON compacts (un par ligne) sur un flux binaire bufferisé.
+
+    Utilisé par `--output jsonl` : aucun objet Rich n'est construit dans ce mode,
+    la sortie est directement ingérable par un pipeline de logs.
+    """
+
+    def __init__(self, stream=None) -> None:
+        self._stream = stream if stream is not None else sys.stdout.buffer
+
+    def emit(self, event: str, **fields: object) -> None:
+        record = {"event": event, **fields}
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+        self._stream.write(line.encode("utf-8") + b"\n")
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+GENERATION_RECORD = ".willkommen.json"
+
+
+def write_generation_record(
+    folder: Path,
+    lang: str,
+    prog_name: str,
+    objective: str,
+    filename: str,
+    files: List[Tuple[str, str]],
+    created: str | None = None,
+) -> None:
+    """Mémorise les paramètres et le contenu généré, base de la fusion à trois voies d'`upgrade`.
+
+    created: date de génération d'origine (ISO) à conserver ; aujourd'hui par défaut.
+    """
+    record = {
+        "lang": lang,
+        "name": prog_name,
+        "objective": objective,
+        "filename": filename,
+        "created": created or __import__('datetime').date.today().isoformat(),
+        "files": {rel: content for rel, content in files},
+    }
+    # json.dump écrit par morceaux : pas de copie intégrale du document en mémoire
+    with (folder / GENERATION_RECORD).open("w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False, indent=1)
+
+
+# -----------------------------
+# VERIFICATION DES FICHIERS GENERES
+# -----------------------------
+# En dessous de ce nombre de contenus distincts, la vérification reste dans le
+# processus courant : démarrer un pool coûterait plus que les validations.
+VERIFY_POOL_THRESHOLD = 64
+
+# Empreinte (type + contenu) -> message d'erreur ou None : un contenu identique
+# n'est validé qu'une fois, même sur des milliers de projets.
+_verify_cache: Dict[str, str | None] = {}
+
+HTML_VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+# Balises dont la fermeture peut être implicite en HTML
+HTML_OPTIONAL_END_TAGS = {
+    "html", "head", "body", "p", "li", "dt", "dd", "option", "optgroup",
+    "tr", "td", "th", "thead", "tbody", "tfoot", "colgroup", "rp", "rt",
+}
+
+
+def validator_kind(rel: str) -> str | None:
+    """Retourne le type de validation applicable à un fichier généré (ou None)."""
+    path = Path(rel)
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        return "json"
+    if suffix == ".py":
+        return "python"
+    if suffix == ".toml":
+        return "toml"
+    if suffix == ".csproj":
+        return "xml"
+    if suffix in (".html", ".htm"):
+        return "html"
+    return None
+
+
+def _validate_html(content: str) -> None:
+    from html.parser import HTMLParser
+
+    class _Balance(HTMLParser):
+        def __init__(self) -> None:
+            super().__init__()
+            self.stack: List[Tuple[str, int]] = []
+
+        def handle_starttag(self, tag, attrs) -> None:  # type: ignore[no-untyped-def]
+            if tag not in HTML_VOID_TAGS:
+                self.stack.append((tag, self.getpos()[0]))
+
+        def handle_startendtag(self, tag, attrs) -> None:  # type: ignore[no-untyped-def]
+            # <meta ... /> : balise auto-fermante, rien à empiler
+            pass
+
+        def handle_endtag(self, tag) -> None:  # type: ignore[no-untyped-def]
+            if all(open_tag != tag for open_tag, _ in self.stack):
+                raise ValueError(f"balise </{tag}> inattendue (ligne {self.getpos()[0]})")
+            while self.stack[-1][0] != tag:
+                open_tag, line = self.stack.pop()
+                if open_tag not in HTML_OPTIONAL_END_TAGS:
+                    raise ValueError(f"balise <{open_tag}> (ligne {line}) non fermée avant </{tag}>")
+            self.stack.pop()
+
+    parser = _Balance()
+    parser.feed(content)
+    parser.close()
+    for tag, line in reversed(parser.stack):
+        if tag not in HTML_OPTIONAL_END_TAGS:
+            raise ValueError(f"balise <{tag}> non fermée (ligne {line})")
+
+
+def validate_content(kind: str, rel: str, content: str) -> str | None:
+    """Valide un contenu selon son type ; retourne le message d'erreur ou None.
+
+    Fonction de module (et non fermeture) pour pouvoir tourner dans un ProcessPool.
+    """
+    try:
+        if kind == "json":
+            json.loads(content)
+        elif kind == "python":
+            # Même contrôle que py_compile, sans écrire de .pyc à côté du projet
+            compile(content, rel, "exec", dont_inherit=True)
+        elif kind == "toml":
+            try:
+                import tomllib
+            except ImportError:  # Python < 3.11
+                try:
+                    import tomli as tomllib  # type: ignore[no-redef]
+                except ImportError:
+                    return None
+            tomllib.loads(content)
+        elif kind == "xml":
+            import xml.etree.ElementTree as ET
+
+            ET.fromstring(content)
+        elif kind == "html":
+            _validate_html(content)
+    except Exception as e:  # chaque parseur a ses propres exceptions
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+def verify_generated(items: List[Tuple[str, str, str]], jobs: int | None = None) -> Dict[str, str]:
+    """Vérifie des fichiers générés et retourne {chemin: erreur} pour les invalides.
+
+    items: (chemin affiché, chemin relatif, contenu). Les contenus déjà validés
+    (cache par empreinte) ne sont pas revérifiés ; les autres sont dédupliqués
+    puis répartis sur un pool de processus si le lot est assez grand.
+    """
+    import hashlib
+
+    keyed: List[Tuple[str, str]] = []
+    pending: Dict[str, Tuple[str, str, str]] = {}
+    for shown, rel, content in items:
+        kind = validator_kind(rel)
+        if kind is None:
+            continue
+        digest = hashlib.sha256(f"{kind}\0{content}".encode("utf-8")).hexdigest()
+        keyed.append((shown, digest))
+        if digest not in _verify_cache and digest not in pending:
+            pending[digest] = (kind, rel, content)
+
+    if len(pending) >= VERIFY_POOL_THRESHOLD:
+        from concurrent.futures import ProcessPoolExecutor
+
+        digests = list(pending)
+        args = [pending[d] for d in digests]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(validate_content, *zip(*args), chunksize=16)
+            _verify_cache.update(zip(digests, results))
+    else:
+        for digest, (kind, rel, content) in pending.items():
+            _verify_cache[digest] = validate_content(kind, rel, content)
+
+    return {shown: _verify_cache[digest] for shown, digest in keyed if _verify_cache[digest]}  # type: ignore[misc]
+
+
+# -----------------------------
+# VENV (template Python)
+# -----------------------------
+def _venv_site_packages(env_dir: Path) -> Path:
+    if sys.platform.startswith("win"):
+        return env_dir / "Lib" / "site-packages"
+    return env_dir / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
+
+
+BASE_VENV_LOCK_TIMEOUT = 600
+
+
+def ensure_base_venv() -> Path:
+    """Retourne l'environnement de base partagé, en le construisant une seule fois.
+
+    pip est installé via `ensurepip` (roue embarquée), donc sans accès réseau.
+    Les paquets communs peuvent être ajoutés une fois pour toutes dans cet
+    environnement ; tous les `.venv` créés avec `--venv` les voient.
+    """
+    import venv
+
+    base = CACHE_DIR / f"base-py{sys.version_info.major}{sys.version_info.minor}"
+    ready = base / ".willkommen-ready"
+    if ready.exists():
+        return base
+
+    # Construire directement au chemin final (les scripts et pyvenv.cfg y font
+    # référence) sous un verrou : un seul processus construit, les autres attendent.
+    ensure_dir(CACHE_DIR)
+    lock = base.with_name(base.name + ".lock")
+    deadline = time.monotonic() + BASE_VENV_LOCK_TIMEOUT
+    while True:
+        try:
+            fd = os.open(str(lock), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if ready.exists():
+                return base
+            try:
+                stale = time.time() - lock.stat().st_mtime > BASE_VENV_LOCK_TIMEOUT
+            except OSError:
+                stale = False
+            if stale:
+                # Constructeur interrompu : reprendre la main
+                lock.unlink(missing_ok=True)
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Verrou {lock} toujours présent")
+            time.sleep(0.2)
+    try:
+        os.close(fd)
+        if not ready.exists():
+            venv.EnvBuilder(with_pip=True, symlinks=not sys.platform.startswith("win"), clear=True).create(base)
+            ready.write_text("", encoding="utf-8")
+    finally:
+        lock.unlink(missing_ok=True)
+    return base
+
+
+def _write_pip_launcher(env_dir: Path) -> None:
+    """Ajoute un lanceur `pip` qui exécute `python -m pip` avec le Python du venv.
+
+    Sans lui, `pip` dans le venv activé serait celui trouvé plus loin dans le
+    PATH, et installerait dans un autre environnement.
+    """
+    if sys.platform.startswith("win"):
+        (env_dir / "Scripts" / "pip.bat").write_text('@"%~dp0python.exe" -m pip %*\r\n', encoding="utf-8")
+        return
+    for name in ("pip", f"pip{sys.version_info.major}"):
+        launcher = env_dir / "bin" / name
+        launcher.write_text('#!/bin/sh\nexec "$(dirname "$0")/python" -m pip "$@"\n', encoding="utf-8")
+        launcher.chmod(0o755)
+
+
+def create_project_venv(project_folder: Path) -> Path:
+    """Crée `.venv` dans le projet en superposant l'environnement de base.
+
+    Le venv du projet est créé sans pip (quelques dizaines de ms) et un fichier
+    `.pth` y ajoute le site-packages de l'environnement de base : pip et les
+    paquets partagés sont disponibles, les installations du projet restent locales.
+    """
+    import venv
+
+    base = ensure_base_venv()
+    env_dir = project_folder / ".venv"
+    venv.EnvBuilder(with_pip=False, symlinks=not sys.platform.startswith("win")).create(env_dir)
+    site = _venv_site_packages(env_dir)
+    ensure_dir(site)
+    (site / "_willkommen_base.pth").write_text(str(_venv_site_packages(base)) + "\n", encoding="utf-8")
+    _write_pip_launcher(env_dir)
+    return env_dir
 
 
 def afficher_contenu_fichier(file_path: Path) -> None:
@@ -499,8 +1277,8 @@ def afficher_contenu_fichier(file_path: Path) -> None:
     console.print()
 
 
-def ajouter_contenu(file_path: Path) -> None:
-    """Ajoute du contenu (ligne par ligne) à la fin d'un fichier jusqu'à saisir FIN."""
+def saisir_lignes() -> List[str]:
+    """Lit des lignes sur l'entrée standard jusqu'à saisir FIN (ou EOF)."""
     console.print("\n💡 [dim]Entrez votre texte (ligne par ligne). Tapez '[cyan]FIN[/cyan]' pour terminer.[/dim]")
     lignes: List[str] = []
     while True:
@@ -511,27 +1289,231 @@ def ajouter_contenu(file_path: Path) -> None:
         if ligne.strip().upper() == "FIN":
             break
         lignes.append(ligne)
+    return lignes
+
+
+def ajouter_contenu(file_path: Path, project: str) -> None:
+    """Ajoute du contenu (ligne par ligne) à la fin d'un fichier jusqu'à saisir FIN.
+
+    project: clé du projet pour --memprofile, la même qu'au rendu et à l'écriture.
+    """
+    lignes = saisir_lignes()
 
     if not lignes:
         console.print("[yellow]Aucune ligne à ajouter.[/yellow]")
         return
 
     try:
-        with file_path.open("a", encoding="utf-8") as f:
-            f.write("\n".join(lignes) + "\n")
+        with mem_phase(project, "append"), file_path.open("a", encoding="utf-8") as f:
+            for ligne in lignes:
+                f.write(ligne)
+                f.write("\n")
         console.print("✅ [cyan italic]Contenu ajouté avec succès ![/cyan italic]\n")
     except Exception as e:
         console.print(f"❌ [red]Erreur lors de l'écriture: {e}[/red]\n")
 
 
+# -----------------------------
+# EDITION PAR NUMERO DE LIGNE
+# -----------------------------
+# Au-delà de cette taille de queue (octets après la zone modifiée), l'édition
+# passe par un fichier temporaire + renommage atomique plutôt qu'en place.
+IN_PLACE_TAIL_LIMIT = 64 * 1024
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Cache des index de lignes : chemin -> (mtime_ns, taille, offsets de début de ligne)
+_line_index_cache: Dict[Path, Tuple[int, int, List[int]]] = {}
+
+
+def line_offsets(file_path: Path) -> List[int]:
+    """Retourne l'offset (octets) du début de chaque ligne, avec cache par (mtime, taille).
+
+    Le fichier est parcouru par blocs, sans être chargé entièrement en mémoire.
+    """
+    key = file_path.resolve()
+    st = key.stat()
+    cached = _line_index_cache.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    offsets: List[int] = [0] if st.st_size else []
+    pos = 0
+    with key.open("rb") as f:
+        while True:
+            chunk = f.read(COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            i = chunk.find(b"\n")
+            while i != -1:
+                offsets.append(pos + i + 1)
+                i = chunk.find(b"\n", i + 1)
+            pos += len(chunk)
+    if offsets and offsets[-1] == st.st_size:
+        # Le dernier saut de ligne termine la dernière ligne, il n'en ouvre pas une nouvelle
+        offsets.pop()
+    _line_index_cache[key] = (st.st_mtime_ns, st.st_size, offsets)
+    return offsets
+
+
+def _copy_range(src, dst, start: int, end: int) -> None:
+    src.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        chunk = src.read(min(COPY_CHUNK_SIZE, remaining))
+        if not chunk:
+            break
+        dst.write(chunk)
+        remaining -= len(chunk)
+
+
+def editer_lignes(file_path: Path, line: int, new_lines: List[str], delete: int = 0) -> None:
+    """Remplace `delete` lignes à partir de la ligne `line` (1-indexée) par `new_lines`.
+
+    - insertion : delete=0 (line peut valoir nb_lignes + 1 pour ajouter en fin)
+    - remplacement : delete >= 1 et new_lines non vide
+    - suppression : new_lines vide
+
+    Si peu d'octets suivent la zone modifiée, l'édition se fait en place ;
+    sinon le fichier est recopié par blocs dans un temporaire puis renommé.
+    Lève ValueError si les numéros de ligne sont hors du fichier.
+    """
+    key = file_path.resolve()
+    offsets = line_offsets(key)
+    size = key.stat().st_size
+    count = len(offsets)
+    if delete < 0:
+        raise ValueError("Le nombre de lignes à supprimer doit être positif")
+    if line < 1 or line > (count + 1 if delete == 0 else count):
+        raise ValueError(f"Ligne {line} hors du fichier ({count} lignes)")
+    if line - 1 + delete > count:
+        raise ValueError(
+            f"Impossible de supprimer {delete} lignes à partir de la ligne {line} : "
+            f"il n'en reste que {count - line + 1}"
+        )
+
+    start = offsets[line - 1] if line <= count else size
+    end_index = line - 1 + delete
+    end = offsets[end_index] if end_index < count else size
+
+    sep = os.linesep.encode()
+    payload = b"".join(l.encode("utf-8") + sep for l in new_lines)
+    prefix = b""
+    if start == size and size:
+        # Fichier sans saut de ligne final : terminer la dernière ligne avant d'ajouter
+        with key.open("rb") as f:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                prefix = sep
+    if not delete and not payload:
+        return
+
+    if size - end <= IN_PLACE_TAIL_LIMIT:
+        with key.open("r+b") as f:
+            f.seek(end)
+            tail = f.read()
+            f.seek(start)
+            f.write(prefix + payload + tail)
+            f.truncate()
+    else:
+        import shutil
+        import tempfile
+
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{key.name}.", dir=str(key.parent))
+        try:
+            with key.open("rb") as src, os.fdopen(fd, "wb") as dst:
+                _copy_range(src, dst, 0, start)
+                dst.write(prefix + payload)
+                _copy_range(src, dst, end, size)
+            shutil.copymode(str(key), tmp_name)
+            os.replace(tmp_name, key)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    # Mettre l'index à jour sans relire le fichier
+    new_starts: List[int] = []
+    pos = start + len(prefix)
+    for l in new_lines:
+        new_starts.append(pos)
+        pos += len(l.encode("utf-8")) + len(sep)
+    delta = len(prefix) + len(payload) - (end - start)
+    updated = offsets[:line - 1] + new_starts + [o + delta for o in offsets[end_index:]]
+    st = key.stat()
+    _line_index_cache[key] = (st.st_mtime_ns, st.st_size, updated)
+
+
+def modifier_lignes(file_path: Path) -> None:
+    """Action du menu : insérer, remplacer ou supprimer à partir d'une ligne donnée."""
+    action = questionary.select(
+        "Quelle modification ?",
+        choices=[
+            "➕ Insérer avant la ligne N",
+            "🔁 Remplacer la ligne N",
+            "🗑️  Supprimer à partir de la ligne N",
+        ],
+        style=CUSTOM_STYLE,
+        qmark=">",
+    ).ask()
+    if not action:
+        return
+
+    try:
+        nb_lignes = len(line_offsets(file_path))
+    except OSError as e:
+        console.print(f"❌ [red]Erreur lors de la lecture: {e}[/red]\n")
+        return
+    numero = questionary.text(
+        f"Numéro de ligne (1-{nb_lignes + 1 if 'Insérer' in action else nb_lignes}):",
+        validate=lambda v: v.isdigit() or "Entrez un nombre",
+        style=CUSTOM_STYLE,
+        qmark=">",
+    ).ask()
+    if not numero:
+        return
+
+    try:
+        if "Insérer" in action:
+            lignes = saisir_lignes()
+            if not lignes:
+                console.print("[yellow]Aucune ligne à insérer.[/yellow]")
+                return
+            editer_lignes(file_path, int(numero), lignes)
+        elif "Remplacer" in action:
+            lignes = saisir_lignes()
+            if not lignes:
+                # FIN immédiat = annulation ; la suppression a sa propre action
+                console.print("[yellow]Aucune ligne saisie, ligne inchangée.[/yellow]")
+                return
+            editer_lignes(file_path, int(numero), lignes, delete=1)
+        else:
+            nombre = questionary.text(
+                f"Nombre de lignes à supprimer (1-{max(nb_lignes - int(numero) + 1, 1)}):",
+                default="1",
+                validate=lambda v: (v.isdigit() and int(v) >= 1) or "Entrez un nombre supérieur ou égal à 1",
+                style=CUSTOM_STYLE,
+                qmark=">",
+            ).ask()
+            if not nombre:
+                return
+            editer_lignes(file_path, int(numero), [], delete=int(nombre))
+        console.print("✅ [cyan italic]Fichier modifié avec succès ![/cyan italic]\n")
+    except ValueError as e:
+        console.print(f"[yellow]{e}[/yellow]\n")
+    except OSError as e:
+        console.print(f"❌ [red]Erreur lors de l'écriture: {e}[/red]\n")
+
 
-def menu_post_creation(primary_file: Path) -> None:
-    """Menu interactif post-création: ajouter, afficher, terminer."""
+def menu_post_creation(primary_file: Path, project: str) -> None:
+    """Menu interactif post-création: ajouter, modifier, afficher, terminer."""
     while True:
         choix = questionary.select(
             "Que voulez-vous faire ?",
             choices=[
                 "✏️  Ajouter du contenu",
+                "🔧 Modifier une ligne",
                 "👀 Afficher le contenu",
                 "✅ Terminer",
             ],
@@ -543,7 +1525,9 @@ def menu_post_creation(primary_file: Path) -> None:
             # Considérer comme Terminer si annulation
             return
         if "Ajouter" in choix:
-            ajouter_contenu(primary_file)
+            ajouter_contenu(primary_file, project)
+        elif "Modifier" in choix:
+            modifier_lignes(primary_file)
         elif "Afficher" in choix:
             afficher_contenu_fichier(primary_file)
         elif "Terminer" in choix:
@@ -551,34 +1535,170 @@ def menu_post_creation(primary_file: Path) -> None:
             return
 
 
-def open_path_target(path: Path, target: str = "file") -> None:
-    """Ouvre un fichier ou dossier avec l'éditeur par défaut.
+# Lanceurs en cours (processus `code` / `open` / `xdg-open`) : bornés pour éviter
+# de créer des centaines de processus lors d'ouvertures en masse. Les commandes
+# en excès attendent dans `_pending_launches` et sont démarrées par un thread
+# démon à mesure que des lanceurs se terminent (l'appelant n'attend jamais).
+MAX_LAUNCHERS = 4
+LAUNCH_BATCH_SIZE = 32
+LAUNCH_POLL_INTERVAL = 0.1
+# Délai laissé aux lanceurs à la sortie du programme avant de rapporter leurs échecs
+LAUNCH_EXIT_GRACE = 2.0
+_launchers: List[Tuple[List[str], subprocess.Popen]] = []
+_pending_launches: "collections.deque[List[str]]" = collections.deque()
+_launch_errors: List[str] = []
+_launch_lock = threading.Lock()
+_launch_thread: Union[threading.Thread, None] = None
+
+
+def _launcher_commands(paths: List[Path]) -> List[List[str]]:
+    """Construit les commandes à lancer (sans shell) pour ouvrir `paths`.
+
+    `code` et `open` acceptent plusieurs chemins : une seule invocation par lot.
+    `xdg-open` n'en accepte qu'un : une invocation par chemin.
+    """
+    from shutil import which
+
+    code = which("code")
+    if code:
+        base = [code]
+        if len(paths) > 1:
+            base.append("--reuse-window")
+    elif sys.platform == "darwin":
+        base = ["open"]
+    else:
+        return [["xdg-open", str(p)] for p in paths]
+    return [
+        base + [str(p) for p in paths[i:i + LAUNCH_BATCH_SIZE]]
+        for i in range(0, len(paths), LAUNCH_BATCH_SIZE)
+    ]
+
+
+def _launch_targets(cmd: List[str]) -> str:
+    return ", ".join(a for a in cmd[1:] if not a.startswith("--"))
+
+
+def _pump_launchers() -> bool:
+    """Récupère les lanceurs terminés et démarre les commandes en attente (sans bloquer).
+
+    Doit être appelé sous `_launch_lock`. Retourne True s'il reste du travail
+    (lanceurs actifs ou commandes en attente).
+    """
+    for cmd, proc in list(_launchers):
+        code = proc.poll()
+        if code is None:
+            continue
+        _launchers.remove((cmd, proc))
+        if code != 0:
+            _launch_errors.append(f"{Path(cmd[0]).name} a échoué (code {code}) pour {_launch_targets(cmd)}")
+    while _pending_launches and len(_launchers) < MAX_LAUNCHERS:
+        cmd = _pending_launches.popleft()
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=not sys.platform.startswith("win"),
+            )
+        except OSError as e:
+            _launch_errors.append(f"Impossible de lancer {cmd[0]}: {e}")
+            continue
+        _launchers.append((cmd, proc))
+    return bool(_launchers or _pending_launches)
+
+
+def _drain_pending_launches() -> None:
+    """Thread démon : démarre les commandes en attente au fil des places libérées."""
+    global _launch_thread
+    while True:
+        with _launch_lock:
+            if not _pending_launches:
+                _launch_thread = None
+                return
+            _pump_launchers()
+        time.sleep(LAUNCH_POLL_INTERVAL)
+
+
+def collect_launch_errors(wait: float = 0.0) -> List[str]:
+    """Récupère les lanceurs terminés et retourne les échecs accumulés depuis le dernier appel.
+
+    wait: délai maximal (secondes) pour laisser les lanceurs actifs (et la file
+    d'attente) se terminer. Les échecs non encore connus restent mémorisés pour
+    un appel ultérieur.
+    """
+    deadline = time.monotonic() + wait
+    while True:
+        with _launch_lock:
+            busy = _pump_launchers()
+            if not busy or time.monotonic() >= deadline:
+                errors = list(_launch_errors)
+                _launch_errors.clear()
+                return errors
+        time.sleep(LAUNCH_POLL_INTERVAL)
+
+
+def _report_late_launch_errors() -> None:
+    """À la sortie : signale les échecs survenus après le retour de `open_paths`."""
+    if not (_launchers or _pending_launches or _launch_errors):
+        return
+    errors = collect_launch_errors(wait=LAUNCH_EXIT_GRACE)
+    with _launch_lock:
+        # Les commandes jamais démarrées ne le seront plus : les signaler aussi
+        while _pending_launches:
+            cmd = _pending_launches.popleft()
+            errors.append(f"{Path(cmd[0]).name} non lancé pour {_launch_targets(cmd)} (trop de lanceurs actifs)")
+    for err in errors:
+        console.print(f"[red]Ouverture impossible:[/red] {err}")
+
+
+atexit.register(_report_late_launch_errors)
+
+
+def open_paths(paths: List[Path]) -> List[str]:
+    """Ouvre plusieurs fichiers/dossiers sans bloquer et retourne les erreurs connues.
+
+    Les lanceurs sont démarrés en arrière-plan (pas de shell) ; au plus
+    MAX_LAUNCHERS tournent simultanément, les suivants sont mis en file et
+    démarrés par un thread démon. Les erreurs de démarrage sont retournées
+    immédiatement ; les échecs plus tardifs par `collect_launch_errors`, ou
+    affichés à la sortie du programme.
+    """
+    global _launch_thread
+    errors: List[str] = []
+    if not paths:
+        return errors
+
+    from shutil import which
+
+    if sys.platform.startswith("win") and not which("code"):
+        for p in paths:
+            try:
+                os.startfile(str(p))  # type: ignore[attr-defined]
+            except OSError as e:
+                errors.append(f"Impossible d'ouvrir {p}: {e}")
+        return errors
+
+    with _launch_lock:
+        _pending_launches.extend(_launcher_commands(paths))
+        _pump_launchers()
+        errors.extend(_launch_errors)
+        _launch_errors.clear()
+        if _pending_launches and _launch_thread is None:
+            _launch_thread = threading.Thread(target=_drain_pending_launches, name="willkommen-launchers", daemon=True)
+            _launch_thread.start()
+    return errors
+
+
+def open_path_target(path: Path, target: str = "file") -> List[str]:
+    """Ouvre un fichier ou dossier avec l'éditeur par défaut, sans bloquer.
 
     target: 'file' pour ouvrir le fichier, 'folder' pour ouvrir le dossier.
     Préfère `code` (VS Code) si présent dans le PATH, sinon utilise
     os.startfile (Windows) ou les commandes `open` / `xdg-open` selon la plateforme.
+    Retourne la liste des erreurs de lancement (vide si tout va bien).
     """
-    try:
-        # Priorité : VS Code CLI si disponible
-        from shutil import which
-
-        if which("code"):
-            if target == "file":
-                os.system(f"code " + f'"{str(path)}"')
-            else:
-                os.system(f"code " + f'"{str(path)}"')
-            return
-
-        if sys.platform.startswith("win"):
-            os.startfile(str(path))
-        elif sys.platform == "darwin":
-            os.system(f"open " + f'"{str(path)}"')
-        else:
-            # Linux / other Unix
-            os.system(f"xdg-open " + f'"{str(path)}"')
-    except Exception:
-        # Silencieux en cas d'échec
-        pass
+    return open_paths([path])
 
 
 def find_hello_world_root_candidates(max_items: int = 30) -> List[Path]:
@@ -764,8 +1884,9 @@ def run_interactive() -> int:
     if create_mode.startswith("📄"):
         # Mode fichier seul: on crée seulement le fichier principal dans dest_dir
         project_folder = dest_dir
+        project = project_key(project_folder)
         # Obtenir le contenu principal depuis le template (si disponible)
-        template_files = LANGUAGES[lang_key]["scaffold"](prog_name, objective, filename)  # type: ignore[index]
+        template_files = scaffold_for(lang_key)(prog_name, objective, filename, project=project)
         primary_rel, primary_content = template_files[0]
 
         # Si le fichier principal est un fichier Python, respecter l'entête demandé
@@ -791,10 +1912,13 @@ def run_interactive() -> int:
     else:
         # Mode dossier: créer un répertoire projet et écrire tous les fichiers du template
         project_folder = dest_dir / prog_name.lower().replace(" ", "-")
-        ensure_dir(project_folder)
-        files = LANGUAGES[lang_key]["scaffold"](prog_name, objective, filename)  # type: ignore[index]
+        project = project_key(project_folder)
+        files = scaffold_for(lang_key)(prog_name, objective, filename, project=project)
 
-    write_files(project_folder, files)
+    # Même clé de projet pour les phases render / write / append de --memprofile
+    write_files(project_folder, files, lang_key, project=project)
+    if not create_mode.startswith("📄"):
+        write_generation_record(project_folder, lang_key, prog_name, objective, filename, files)
     console.print(Panel(f"✅ Projet [bold]{prog_name}[/bold] créé dans [cyan]{project_folder}[/cyan]", border_style="green", box=box.ROUNDED))
 
     # Déterminer le fichier principal (1er élément retourné par le template)
@@ -804,7 +1928,7 @@ def run_interactive() -> int:
 
         # D'abord proposer le menu post-création (ajout/affichage/terminer)
         if primary_file.exists():
-            menu_post_creation(primary_file)
+            menu_post_creation(primary_file, project)
 
             # Une fois l'utilisateur a choisi Terminer, lui proposer d'ouvrir le projet
             open_choice = questionary.select(
@@ -818,10 +1942,15 @@ def run_interactive() -> int:
                 qmark=">",
             ).ask()
 
+            launch_errors: List[str] = []
             if open_choice and "dossier" in open_choice.lower():
-                open_path_target(project_folder, target="folder")
+                launch_errors = open_path_target(project_folder, target="folder")
             elif open_choice and "fichier" in open_choice.lower():
-                open_path_target(primary_file, target="file")
+                launch_errors = open_path_target(primary_file, target="file")
+            # Échecs immédiats seulement : les échecs tardifs sont affichés à la sortie
+            launch_errors += collect_launch_errors()
+            for err in launch_errors:
+                console.print(f"[red]Ouverture impossible:[/red] {err}")
     except Exception:
         # Si problème, ignorer silencieusement
         pass
@@ -833,7 +1962,85 @@ def run_interactive() -> int:
 # -----------------------------
 # CLI (non-interactif)
 # -----------------------------
+def run_cli_jsonl(args: argparse.Namespace) -> int:
+    """Variante de `run_cli` pour `--output jsonl` : un événement par étape du projet.
+
+    Événements : planned, written, skipped, error (chemins, octets, durées en ms).
+    """
+    out = JsonlWriter()
+    try:
+        if args.lang not in LANGUAGES:
+            out.emit("error", name=args.name, error=f"Langage inconnu: {args.lang}")
+            return 2
+        if not args.name or not args.objective:
+            out.emit("error", name=args.name, error="--name et --objective sont requis")
+            return 2
+        if args.venv and args.lang != "python":
+            out.emit("error", name=args.name, error="--venv n'est disponible que pour --lang python")
+            return 2
+        dest_dir = Path(args.dir or Path.cwd())
+        filename = args.filename or LANGUAGES[args.lang]["default_file"]  # type: ignore[index]
+        project_folder = dest_dir / args.name.lower().replace(" ", "-")
+
+        t0 = time.perf_counter()
+        files = scaffold_for(args.lang)(args.name, args.objective, filename, project=project_key(project_folder))
+        render_ms = (time.perf_counter() - t0) * 1000
+        out.emit(
+            "planned",
+            lang=args.lang,
+            name=args.name,
+            path=str(project_folder),
+            files=[rel for rel, _ in files],
+            render_ms=round(render_ms, 3),
+        )
+        if not args.yes:
+            out.emit("skipped", name=args.name, path=str(project_folder), reason="--yes absent")
+            return 0
+
+        t0 = time.perf_counter()
+        try:
+            written = write_files(project_folder, files, args.lang, project=project_key(project_folder))
+            write_generation_record(project_folder, args.lang, args.name, args.objective, filename, files)
+        except OSError as e:
+            out.emit("error", name=args.name, path=str(project_folder), error=str(e))
+            return 1
+        write_ms = (time.perf_counter() - t0) * 1000
+        out.emit(
+            "written",
+            name=args.name,
+            path=str(project_folder),
+            files=len(files),
+            bytes=written,
+            write_ms=round(write_ms, 3),
+        )
+
+        if args.verify:
+            t0 = time.perf_counter()
+            invalid = verify_generated([(str(project_folder / rel), rel, content) for rel, content in files])
+            for path, error in invalid.items():
+                out.emit("invalid", name=args.name, path=path, error=error)
+            out.emit("verified", name=args.name, path=str(project_folder), invalid=len(invalid),
+                     verify_ms=round((time.perf_counter() - t0) * 1000, 3))
+            if invalid:
+                return 1
+
+        if args.venv:
+            t0 = time.perf_counter()
+            try:
+                env_dir = create_project_venv(project_folder)
+            except Exception as e:
+                out.emit("error", name=args.name, path=str(project_folder / ".venv"), error=str(e))
+                return 1
+            out.emit("venv", name=args.name, path=str(env_dir), venv_ms=round((time.perf_counter() - t0) * 1000, 3))
+        return 0
+    finally:
+        out.flush()
+
+
 def run_cli(args: argparse.Namespace) -> int:
+    if getattr(args, "output", "rich") == "jsonl":
+        return run_cli_jsonl(args)
+
     # validations minimales
     if args.lang not in LANGUAGES:
         console.print(f"[red]Langage inconnu:[/red] {args.lang}\nChoix possibles: {', '.join(LANGUAGES.keys())}")
@@ -844,6 +2051,9 @@ def run_cli(args: argparse.Namespace) -> int:
     if not args.objective:
         console.print("[red]--objective est requis en mode non-interactif[/red]")
         return 2
+    if args.venv and args.lang != "python":
+        console.print("[red]--venv n'est disponible que pour --lang python[/red]")
+        return 2
     dest_dir = Path(args.dir or Path.cwd())
     filename = args.filename or LANGUAGES[args.lang]["default_file"]  # type: ignore[index]
 
@@ -853,20 +2063,562 @@ def run_cli(args: argparse.Namespace) -> int:
         return 0
 
     project_folder = dest_dir / args.name.lower().replace(" ", "-")
-    ensure_dir(project_folder)
-    files = LANGUAGES[args.lang]["scaffold"](args.name, args.objective, filename)  # type: ignore[index]
-    write_files(project_folder, files)
+    files = scaffold_for(args.lang)(args.name, args.objective, filename, project=project_key(project_folder))
+    try:
+        write_files(project_folder, files, args.lang, project=project_key(project_folder))
+        write_generation_record(project_folder, args.lang, args.name, args.objective, filename, files)
+    except OSError as e:
+        console.print(f"[red]Erreur lors de l'écriture dans {project_folder}: {e}[/red]")
+        return 1
 
     console.print(Panel(f"✅ Projet [bold]{args.name}[/bold] créé dans [cyan]{project_folder}[/cyan]", border_style="green", box=box.ROUNDED))
+
+    if args.verify:
+        invalid = verify_generated([(str(project_folder / rel), rel, content) for rel, content in files])
+        for path, error in invalid.items():
+            console.print(f"[red]Fichier invalide:[/red] {path} — {error}")
+        if invalid:
+            return 1
+
+    if args.venv:
+        try:
+            env_dir = create_project_venv(project_folder)
+        except Exception as e:
+            console.print(f"[red]Erreur lors de la création du venv: {e}[/red]")
+            return 1
+        console.print(f"🐍 [cyan]Environnement prêt:[/cyan] {env_dir}")
+        console.print("[dim]Installez les dépendances avec `python -m pip install -r requirements.txt` (venv activé).[/dim]")
     return 0
 
 
-def parse_args(argv: List[str]) -> argparse.Namespace:
+# -----------------------------
+# WATCH (manifeste -> scaffolds incrémentaux)
+# -----------------------------
+WATCH_POLL_INTERVAL = 0.25
+WATCH_DEBOUNCE = 0.2
+
+
+def read_manifest(manifest: Path) -> Dict[str, Dict[str, str]]:
+    """Lit un manifeste CSV (colonnes: lang, name, objective, [filename], [dir]).
+
+    Retourne les lignes indexées par dossier projet (dir/nom-normalisé) ;
+    les lignes vides ou sans nom sont ignorées.
+    """
+    import csv
+
+    rows: Dict[str, Dict[str, str]] = {}
+    with manifest.open(newline="", encoding="utf-8") as f:
+        for raw in csv.DictReader(f):
+            row = {k.strip(): (v or "").strip() for k, v in raw.items() if k}
+            if not row.get("name"):
+                continue
+            base = Path(row.get("dir") or manifest.parent)
+            if not base.is_absolute():
+                base = manifest.parent / base
+            row["dir"] = str(base)
+            rows[str(base / row["name"].lower().replace(" ", "-"))] = row
+    return rows
+
+
+def _row_digest(row: Dict[str, str]) -> str:
+    import hashlib
+
+    return hashlib.sha1(json.dumps(row, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def update_generated_project(
+    project: Path, lang: str, prog_name: str, objective: str, filename: str
+) -> Dict[str, object]:
+    """Applique de nouveaux paramètres (ligne de manifeste modifiée) à un projet existant.
+
+    Même fusion à trois voies qu'`upgrade` : les lignes ajoutées par l'étudiant
+    sont conservées, les conflits écrits dans `<fichier>.merge`. Sans
+    enregistrement de génération, tout fichier existant différent du rendu est
+    un conflit. Retourne les listes merged / added / conflicts.
+    """
+    record_path = project / GENERATION_RECORD
+    try:
+        record = json.loads(record_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        record = {}
+    created = record.get("created")
+    files = scaffold_for(lang)(prog_name, objective, filename, created=created, project=project_key(project))
+    result: Dict[str, object] = {"path": str(project), "merged": [], "added": [], "conflicts": [], "unchanged": 0}
+    new_bases = merge_template_files(project, files, record.get("files", {}), result)
+    write_generation_record(project, lang, prog_name, objective, filename, list(new_bases.items()), created=created)
+    return result
+
+
+def apply_manifest_delta(
+    manifest: Path, state: Dict[str, str], out: JsonlWriter | None, verify: bool = False
+) -> Dict[str, str]:
+    """Scaffolde uniquement les lignes nouvelles ou modifiées depuis `state`.
+
+    state: dossier projet -> empreinte de la ligne appliquée. Retourne le nouvel état.
+    verify: valider l'ensemble des fichiers écrits du lot en une passe.
+    """
+    try:
+        rows = read_manifest(manifest)
+    except (OSError, ValueError) as e:
+        if out:
+            out.emit("error", path=str(manifest), error=str(e))
+        else:
+            console.print(f"[red]Manifeste illisible:[/red] {e}")
+        return state
+
+    new_state = dict(state)
+    to_verify: List[Tuple[str, str, str]] = []
+    for folder, row in rows.items():
+        digest = _row_digest(row)
+        if state.get(folder) == digest:
+            continue
+        lang = row.get("lang", "")
+        if lang not in LANGUAGES or not row.get("objective"):
+            msg = f"Langage inconnu: {lang}" if lang not in LANGUAGES else "objective manquant"
+            if out:
+                out.emit("error", name=row["name"], path=folder, error=msg)
+            else:
+                console.print(f"[red]{row['name']}:[/red] {msg}")
+            continue
+        filename = row.get("filename") or LANGUAGES[lang]["default_file"]  # type: ignore[index]
+        project = Path(folder)
+        t0 = time.perf_counter()
+        try:
+            if project.exists():
+                # Projet existant : ne jamais écraser le travail de l'étudiant
+                merge = update_generated_project(project, lang, row["name"], row["objective"], filename)
+                files = [(rel, (project / rel).read_text(encoding="utf-8")) for rel in merge["merged"] + merge["added"]]  # type: ignore[operator]
+                written = None
+            else:
+                merge = None
+                key = project_key(project)
+                files = scaffold_for(lang)(row["name"], row["objective"], filename, project=key)
+                written = write_files(project, files, lang, project=key)
+                write_generation_record(project, lang, row["name"], row["objective"], filename, files)
+        except (OSError, ValueError) as e:
+            if out:
+                out.emit("error", name=row["name"], path=folder, error=str(e))
+            else:
+                console.print(f"[red]{row['name']}:[/red] {e}")
+            continue
+        new_state[folder] = digest
+        if verify:
+            to_verify.extend((str(project / rel), rel, content) for rel, content in files)
+        if merge is not None:
+            for result_kind, key in (("merged", "merged"), ("added", "added"), ("conflict", "conflicts")):
+                if merge[key]:
+                    METRICS.inc("willkommen_upgrade_files", len(merge[key]), result=result_kind)  # type: ignore[arg-type]
+        if out:
+            fields: Dict[str, object] = {"files": len(files), "bytes": written} if merge is None else {
+                key: merge[key] for key in ("merged", "added", "conflicts")
+            }
+            out.emit(
+                "written",
+                name=row["name"],
+                path=folder,
+                write_ms=round((time.perf_counter() - t0) * 1000, 3),
+                change="updated" if merge is not None else "added",
+                **fields,
+            )
+        elif merge is None:
+            console.print(f"✅ [bold]{row['name']}[/bold] créé dans [cyan]{folder}[/cyan]")
+        elif merge["conflicts"]:
+            console.print(
+                f"⚠️  [bold]{row['name']}[/bold] mis à jour dans [cyan]{folder}[/cyan] — "
+                f"[red]conflits:[/red] {', '.join(merge['conflicts'])} (voir *.merge)"  # type: ignore[arg-type]
+            )
+        else:
+            console.print(f"✅ [bold]{row['name']}[/bold] mis à jour dans [cyan]{folder}[/cyan]")
+    if to_verify:
+        for path, error in verify_generated(to_verify).items():
+            if out:
+                out.emit("invalid", path=path, error=error)
+            else:
+                console.print(f"[red]Fichier invalide:[/red] {path} — {error}")
+    if out:
+        out.flush()
+    return new_state
+
+
+def _start_fs_notifier(manifest: Path, changed) -> object | None:
+    """Démarre une notification système (watchdog, si installé) sur le manifeste.
+
+    Retourne l'observateur ou None : la boucle de `run_watch` reste alors en polling.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    target = str(manifest.resolve())
+
+    class _Handler(FileSystemEventHandler):
+        def on_any_event(self, event) -> None:  # type: ignore[no-untyped-def]
+            paths = {getattr(event, "src_path", ""), getattr(event, "dest_path", "")}
+            if target in paths:
+                changed.set()
+
+    observer = Observer()
+    observer.schedule(_Handler(), str(manifest.resolve().parent), recursive=False)
+    observer.daemon = True
+    observer.start()
+    return observer
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    """Surveille un manifeste et applique les changements au fil de l'eau."""
+    manifest = Path(args.manifest).resolve()
+    state_file = manifest.with_name(f".{manifest.name}.willkommen-state.json")
+    out = JsonlWriter() if args.output == "jsonl" else None
+
+    try:
+        state: Dict[str, str] = json.loads(state_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = {}
+
+    def signature() -> Tuple[int, int] | None:
+        try:
+            st = manifest.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def apply() -> None:
+        nonlocal state
+        new_state = apply_manifest_delta(manifest, state, out, args.verify)
+        if new_state != state:
+            state = new_state
+            tmp = state_file.with_name(state_file.name + ".tmp")
+            tmp.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(tmp, state_file)
+        if args.metrics_file:
+            METRICS.write_textfile(Path(args.metrics_file))
+
+    last = signature()
+    if last is not None:
+        apply()
+    if args.once:
+        return 0
+
+    if args.metrics_port:
+        METRICS.serve(args.metrics_port)
+        if out is None:
+            console.print(f"📈 [cyan]Métriques:[/cyan] http://127.0.0.1:{args.metrics_port}/metrics")
+
+    changed = threading.Event()
+    observer = _start_fs_notifier(manifest, changed)
+    if out is None:
+        mode = "notifications" if observer else "polling"
+        console.print(f"👀 [cyan]Surveillance de[/cyan] {manifest} [dim]({mode}, Ctrl+C pour arrêter)[/dim]")
+    try:
+        while True:
+            changed.wait(WATCH_POLL_INTERVAL)
+            changed.clear()
+            current = signature()
+            if current == last or current is None:
+                continue
+            # Anti-rebond : attendre que le fichier soit stable avant d'appliquer le lot
+            while True:
+                time.sleep(WATCH_DEBOUNCE)
+                settled = signature()
+                if settled == current:
+                    break
+                current = settled
+            last = current
+            apply()
+    finally:
+        if observer is not None:
+            observer.stop()  # type: ignore[attr-defined]
+
+
+# -----------------------------
+# UPGRADE (fusion à trois voies des templates)
+# -----------------------------
+UPGRADE_SKIP_DIRS = {".git", ".venv", "venv", "node_modules", "target", "dist", "bin", "obj", "__pycache__"}
+
+
+def merge3(base: str, ours: str, theirs: str) -> Tuple[str, int]:
+    """Fusion à trois voies ligne à ligne (à la diff3).
+
+    base: contenu généré à l'origine, ours: fichier sur disque, theirs: nouveau template.
+    Retourne (texte fusionné, nombre de conflits) ; les conflits sont balisés
+    avec des marqueurs <<<<<<< / ======= / >>>>>>>. Contrairement à git, deux
+    modifications de lignes adjacentes fusionnent sans conflit ; deux insertions
+    au même endroit restent en conflit.
+    """
+    if ours == theirs or theirs == base:
+        return ours, 0
+    if ours == base:
+        return theirs, 0
+
+    from difflib import SequenceMatcher
+
+    b = base.splitlines(keepends=True)
+    o = ours.splitlines(keepends=True)
+    t = theirs.splitlines(keepends=True)
+    o_ops = SequenceMatcher(None, b, o, autojunk=False).get_opcodes()
+    t_ops = SequenceMatcher(None, b, t, autojunk=False).get_opcodes()
+
+    def to_side(ops, pos: int, end: bool) -> int:
+        # Position dans la version modifiée correspondant à `pos` dans base ; aux
+        # frontières d'une insertion, `end` choisit l'après plutôt que l'avant.
+        candidates = []
+        for tag, i1, i2, j1, j2 in ops:
+            if tag == "equal" and i1 <= pos <= i2:
+                candidates.append(j1 + (pos - i1))
+            elif tag != "equal":
+                if pos == i1:
+                    candidates.append(j1)
+                if pos == i2:
+                    candidates.append(j2)
+        if not candidates:
+            return 0
+        return max(candidates) if end else min(candidates)
+
+    changes = sorted(
+        [(i1, i2, "o") for tag, i1, i2, _, _ in o_ops if tag != "equal"]
+        + [(i1, i2, "t") for tag, i1, i2, _, _ in t_ops if tag != "equal"]
+    )
+    merged: List[str] = []
+    conflicts = 0
+    pos = 0
+    k = 0
+    while k < len(changes):
+        lo, hi, _ = changes[k]
+        sides = {changes[k][2]}
+        k += 1
+        # Regrouper les changements qui se chevauchent ; deux changements
+        # simplement adjacents restent séparés, sauf si l'un est une insertion
+        # (l'ordre des lignes insérées serait alors ambigu)
+        while k < len(changes):
+            c_lo, c_hi, side = changes[k]
+            if not (c_lo < hi or (c_lo == hi and (c_lo == c_hi or lo == hi))):
+                break
+            hi = max(hi, c_hi)
+            sides.add(side)
+            k += 1
+        merged.extend(b[pos:lo])
+        o_seg = o[to_side(o_ops, lo, False):to_side(o_ops, hi, True)]
+        t_seg = t[to_side(t_ops, lo, False):to_side(t_ops, hi, True)]
+        if sides == {"o"} or o_seg == t_seg:
+            merged.extend(o_seg)
+        elif sides == {"t"}:
+            merged.extend(t_seg)
+        else:
+            conflicts += 1
+            merged.append("<<<<<<< local\n")
+            merged.extend(o_seg)
+            if o_seg and not o_seg[-1].endswith("\n"):
+                merged.append("\n")
+            merged.append("=======\n")
+            merged.extend(t_seg)
+            if t_seg and not t_seg[-1].endswith("\n"):
+                merged.append("\n")
+            merged.append(">>>>>>> template\n")
+        pos = hi
+    merged.extend(b[pos:])
+    return "".join(merged), conflicts
+
+
+def find_generated_projects(roots: List[Path]) -> List[Path]:
+    """Retourne les dossiers contenant un enregistrement de génération, sans descendre dans les projets."""
+    found: List[Path] = []
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            if GENERATION_RECORD in filenames:
+                found.append(Path(dirpath))
+                dirnames[:] = []
+                continue
+            dirnames[:] = [d for d in dirnames if d not in UPGRADE_SKIP_DIRS]
+    return found
+
+
+def merge_template_files(
+    project: Path,
+    files: List[Tuple[str, str]],
+    bases: Dict[str, str],
+    result: Dict[str, object],
+    dry_run: bool = False,
+) -> Dict[str, str]:
+    """Fusionne (à trois voies) le rendu `files` dans les fichiers existants de `project`.
+
+    bases: contenu généré précédemment, par chemin relatif. Les fichiers absents
+    sont créés, les fusions propres écrites, les conflits écrits à côté
+    (`<fichier>.merge`) sans toucher au fichier d'origine. Complète les listes
+    de `result` et retourne les nouvelles bases.
+    """
+    new_bases = dict(bases)
+    for rel, theirs in files:
+        target = project / rel
+        base = bases.get(rel)
+        try:
+            ours = target.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            if base is None:
+                # Fichier nouveau dans le template
+                if not dry_run:
+                    ensure_dir(target.parent)
+                    target.write_text(theirs, encoding="utf-8")
+                result["added"].append(rel)  # type: ignore[union-attr]
+                new_bases[rel] = theirs
+            # Sinon : supprimé volontairement par l'étudiant, on respecte ce choix
+            continue
+        except (OSError, UnicodeDecodeError) as e:
+            result["conflicts"].append(f"{rel} ({e})")  # type: ignore[union-attr]
+            continue
+
+        merged, conflicts = merge3(base or "", ours, theirs)
+        if conflicts:
+            if not dry_run:
+                target.with_name(target.name + ".merge").write_text(merged, encoding="utf-8")
+            result["conflicts"].append(rel)  # type: ignore[union-attr]
+            continue
+        new_bases[rel] = theirs
+        if merged == ours:
+            result["unchanged"] += 1  # type: ignore[operator]
+            continue
+        if not dry_run:
+            target.write_text(merged, encoding="utf-8")
+        result["merged"].append(rel)  # type: ignore[union-attr]
+    return new_bases
+
+
+def upgrade_project(folder: str, dry_run: bool = False) -> Dict[str, object]:
+    """Met à jour un projet vers la version actuelle de son template.
+
+    Exécuté dans un processus du pool : ne touche pas à la console.
+    Les fusions propres sont écrites ; les conflits sont écrits à côté
+    (`<fichier>.merge`) et le fichier d'origine n'est pas modifié.
+    """
+    project = Path(folder)
+    result: Dict[str, object] = {"path": folder, "merged": [], "added": [], "conflicts": [], "unchanged": 0}
+    try:
+        record = json.loads((project / GENERATION_RECORD).read_text(encoding="utf-8"))
+        lang = record["lang"]
+        # Date de génération : celle de l'enregistrement, sinon (anciens
+        # enregistrements) la date de dernière écriture du fichier
+        created = record.get("created") or __import__('datetime').date.fromtimestamp(
+            (project / GENERATION_RECORD).stat().st_mtime
+        ).isoformat()
+        files = scaffold_for(lang)(record["name"], record["objective"], record["filename"], created=created)
+    except (OSError, ValueError, KeyError) as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    bases: Dict[str, str] = record.get("files", {})
+    new_bases = merge_template_files(project, files, bases, result, dry_run)
+
+    if not dry_run and new_bases != bases:
+        record["files"] = new_bases
+        record["created"] = created
+        (project / GENERATION_RECORD).write_text(json.dumps(record, ensure_ascii=False, indent=1), encoding="utf-8")
+    return result
+
+
+def run_upgrade(args: argparse.Namespace) -> int:
+    """Applique les templates actuels aux projets déjà générés, en parallèle."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    projects = find_generated_projects([Path(d) for d in args.dirs])
+    out = JsonlWriter() if args.output == "jsonl" else None
+    if not projects:
+        if out is None:
+            console.print(f"[yellow]Aucun projet trouvé ({GENERATION_RECORD} absent).[/yellow]")
+        return 0
+
+    jobs = args.jobs or os.cpu_count() or 1
+    failed = False
+    # Lots de projets par tâche : limite le coût d'échange entre processus
+    chunksize = max(1, len(projects) // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(upgrade_project, [str(p) for p in projects], [args.dry_run] * len(projects), chunksize=chunksize)
+        for res in results:
+            failed = failed or bool(res.get("error") or res["conflicts"])
+            for result_kind, key in (("merged", "merged"), ("added", "added"), ("conflict", "conflicts")):
+                if res[key]:
+                    METRICS.inc("willkommen_upgrade_files", len(res[key]), result=result_kind)  # type: ignore[arg-type]
+            if res.get("error"):
+                METRICS.inc("willkommen_upgrade_failures")
+            if out is not None:
+                out.emit("upgraded" if not res.get("error") else "error", **res)
+                continue
+            if res.get("error"):
+                console.print(f"[red]{res['path']}:[/red] {res['error']}")
+            elif res["merged"] or res["added"] or res["conflicts"]:
+                parts = []
+                if res["merged"]:
+                    parts.append(f"[green]fusionnés:[/green] {', '.join(res['merged'])}")  # type: ignore[arg-type]
+                if res["added"]:
+                    parts.append(f"[cyan]ajoutés:[/cyan] {', '.join(res['added'])}")  # type: ignore[arg-type]
+                if res["conflicts"]:
+                    parts.append(f"[red]conflits:[/red] {', '.join(res['conflicts'])}")  # type: ignore[arg-type]
+                console.print(f"{res['path']} — " + " | ".join(parts))
+    if out is not None:
+        out.flush()
+    return 1 if failed else 0
+
+
+# -----------------------------
+# COMPLETION SHELL
+# -----------------------------
+def build_completion_index() -> Dict[str, object]:
+    """Extrait du parser les sous-commandes, options et choix pour `willkommen_complete.py`."""
+    parser = build_parser()
+    index: Dict[str, object] = {"subcommands": [], "options": {}, "takes_value": {}, "choices": {}}
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            for name, subparser in action.choices.items():
+                index["subcommands"].append(name)  # type: ignore[union-attr]
+                options: List[str] = []
+                takes_value: List[str] = []
+                choices: Dict[str, List[str]] = {}
+                for sub_action in subparser._actions:
+                    options.extend(sub_action.option_strings)
+                    if sub_action.option_strings and sub_action.nargs != 0:
+                        takes_value.extend(sub_action.option_strings)
+                        if sub_action.choices:
+                            for opt in sub_action.option_strings:
+                                choices[opt] = [str(c) for c in sub_action.choices]
+                    elif not sub_action.option_strings and sub_action.choices:
+                        # Argument positionnel à choix (ex: `completion bash`)
+                        choices[""] = [str(c) for c in sub_action.choices]
+                index["options"][name] = options  # type: ignore[index]
+                index["takes_value"][name] = takes_value  # type: ignore[index]
+                index["choices"][name] = choices  # type: ignore[index]
+    return index
+
+
+def run_completion(args: argparse.Namespace) -> int:
+    """Affiche le script d'activation de la complétion et régénère l'index."""
+    import shlex
+
+    import willkommen_complete
+
+    willkommen_complete.save_index(build_completion_index())
+    helper = Path(willkommen_complete.__file__).resolve()
+    script = Path(__file__).resolve()
+    # Chemins avec espaces : quoter chaque chemin, puis la commande entière pour -C
+    command = f"{shlex.quote(sys.executable)} -S {shlex.quote(str(helper))}"
+    lines = []
+    if args.shell == "zsh":
+        lines.append("autoload -U +X bashcompinit && bashcompinit")
+    # `./willkommen_v2.py` retombe sur le nom seul ; `run.sh` n'est enregistré que
+    # sous les formes `./run.sh` et chemin absolu (nom trop courant ailleurs)
+    launcher = script.with_name("run.sh")
+    for cmd in (script.name, str(script), f"./{launcher.name}", str(launcher)):
+        lines.append(f"complete -o default -C {shlex.quote(command)} {shlex.quote(cmd)}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Générateur de projet multi-langages")
     sub = p.add_subparsers(dest="mode")
 
     # mode interactif (par défaut si aucun subcmd)
-    sub.add_parser("interactive", help="Lancer l'assistant interactif")
+    i = sub.add_parser("interactive", help="Lancer l'assistant interactif")
+    i.add_argument("--memprofile", action="store_true", help="Profiler la mémoire (tracemalloc) des phases render/write/append")
 
     # mode non-interactif
     c = sub.add_parser("new", help="Créer un projet en mode non-interactif")
@@ -877,21 +2629,82 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     c.add_argument("--filename", help="Nom du fichier principal (défaut selon langage)")
     c.add_argument("--yes", action="store_true", help="Confirmer sans poser de question")
     c.add_argument("--file-only", action="store_true", help="Créer uniquement le fichier principal (pas de dossier)")
+    c.add_argument("--venv", action="store_true", help="Python: créer .venv à partir de l'environnement de base en cache (hors-ligne)")
+    c.add_argument("--output", choices=["rich", "jsonl"], default="rich", help="Format de sortie (jsonl: un événement JSON par ligne, sans rendu Rich)")
+    c.add_argument("--verify", action="store_true", help="Valider les fichiers générés (JSON, Python, TOML, XML, HTML)")
+    c.add_argument("--memprofile", action="store_true", help="Profiler la mémoire (tracemalloc) des phases render/write")
+    c.add_argument("--metrics-file", help="Écrire les métriques (format OpenMetrics) dans ce fichier")
+
+    # surveillance d'un manifeste
+    w = sub.add_parser("watch", help="Surveiller un manifeste CSV et scaffolder les projets ajoutés/modifiés")
+    w.add_argument("manifest", help="Fichier CSV (colonnes: lang,name,objective[,filename][,dir])")
+    w.add_argument("--once", action="store_true", help="Appliquer les changements une fois puis quitter")
+    w.add_argument("--output", choices=["rich", "jsonl"], default="rich", help="Format de sortie (jsonl: un événement JSON par ligne)")
+    w.add_argument("--verify", action="store_true", help="Valider les fichiers générés (JSON, Python, TOML, XML, HTML)")
+    w.add_argument("--memprofile", action="store_true", help="Profiler la mémoire (tracemalloc) des phases render/write")
+    w.add_argument("--metrics-file", help="Écrire les métriques (format OpenMetrics) dans ce fichier")
+    w.add_argument("--metrics-port", type=int, help="Exposer /metrics sur 127.0.0.1:PORT pendant la surveillance")
+
+    # mise à jour des projets existants
+    u = sub.add_parser("upgrade", help="Mettre à jour les projets générés vers les templates actuels (fusion à trois voies)")
+    u.add_argument("dirs", nargs="+", help="Dossiers à parcourir à la recherche de projets générés")
+    u.add_argument("--jobs", type=int, help="Nombre de processus (défaut: nombre de cœurs)")
+    u.add_argument("--dry-run", action="store_true", help="Calculer les fusions sans rien écrire")
+    u.add_argument("--output", choices=["rich", "jsonl"], default="rich", help="Format de sortie (jsonl: un événement JSON par projet)")
+    u.add_argument("--metrics-file", help="Écrire les métriques (format OpenMetrics) dans ce fichier")
+
+    # bundle des templates
+    bnd = sub.add_parser("bundle", help="Gérer le bundle des templates (fichier unique mappé en mémoire)")
+    bnd.add_argument("action", choices=["build"], help="build: (re)générer le bundle depuis les templates intégrés")
+    bnd.add_argument("--path", help="Chemin du bundle (défaut: cache utilisateur ou $WILLKOMMEN_BUNDLE)")
+
+    # complétion shell
+    comp = sub.add_parser("completion", help="Afficher le script de complétion shell (bash/zsh)")
+    comp.add_argument("shell", nargs="?", choices=["bash", "zsh"], default="bash", help="Shell cible")
+
+    return p
+
 
+def parse_args(argv: List[str]) -> argparse.Namespace:
     # Pas de subcmd => interactif
     if len(argv) == 0:
         return argparse.Namespace(mode="interactive")
-    return p.parse_args(argv)
+    return build_parser().parse_args(argv)
 
 
 def main(argv: List[str] | None = None) -> int:
     argv = argv if argv is not None else sys.argv[1:]
     args = parse_args(argv)
+    global _memprofiler
+    if getattr(args, "memprofile", False):
+        _memprofiler = MemProfiler()
+    try:
+        return _dispatch(args)
+    finally:
+        if getattr(args, "metrics_file", None):
+            METRICS.write_textfile(Path(args.metrics_file))
+        if _memprofiler is not None:
+            if getattr(args, "output", "rich") == "jsonl":
+                out = JsonlWriter()
+                out.emit("memprofile", **_memprofiler.report())
+                out.flush()
+            else:
+                _memprofiler.print_report()
+
 
+def _dispatch(args: argparse.Namespace) -> int:
     if args.mode == "interactive":
         return run_interactive()
     elif args.mode == "new":
         return run_cli(args)
+    elif args.mode == "watch":
+        return run_watch(args)
+    elif args.mode == "upgrade":
+        return run_upgrade(args)
+    elif args.mode == "bundle":
+        return run_bundle(args)
+    elif args.mode == "completion":
+        return run_completion(args)
     else:
         # fallback interactif
         return run_interactive()